@@ -13,9 +13,10 @@ Security: Uses parameterized queries only, following OWASP guidelines.
 
 import logging
 import os
+import re
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 # Configure logging
 logging.basicConfig(
@@ -23,6 +24,50 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Tokens that matter when splitting a script into statements. Unterminated
+# strings and comments run to the end of the script.
+_SQL_TOKEN_RE = re.compile(
+    r"""
+    (?P<quoted>
+        '(?:[^'\\]|\\.|'')*(?:'|\Z)
+      | "(?:[^"\\]|\\.|"")*(?:"|\Z)
+      | `[^`]*(?:`|\Z)
+    )
+  | (?P<comment>--(?=\s|$)[^\n]*|\#[^\n]*|/\*.*?(?:\*/|\Z))
+  | (?P<end>;)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+
+def _split_sql_statements(sql_content: str) -> List[str]:
+    """Split a SQL script on ';' terminators outside quotes and comments.
+
+    Comment-only chunks are dropped so the driver never receives an empty query.
+    """
+    statements: List[str] = []
+    start = 0
+    pos = 0
+    has_code = False
+
+    for token in _SQL_TOKEN_RE.finditer(sql_content):
+        if not has_code and sql_content[pos : token.start()].strip():
+            has_code = True
+        pos = token.end()
+
+        kind = token.lastgroup
+        if kind == "quoted":
+            has_code = True
+        elif kind == "end":
+            if has_code:
+                statements.append(sql_content[start : token.start()].strip())
+            start = pos
+            has_code = False
+
+    if has_code or sql_content[pos:].strip():
+        statements.append(sql_content[start:].strip())
+    return statements
+
 
 def setup_tables(connection_string: Optional[str] = None):
     """Set up music title parser module tables with security validation."""
@@ -39,9 +84,9 @@ def setup_tables(connection_string: Optional[str] = None):
         print(f"❌ SQL file not found: {sql_file}")
         return False
 
-    # Read SQL
+    # Read and split SQL once, before touching the database
     with open(sql_file) as f:
-        sql_content = f.read()
+        statements = _split_sql_statements(f.read())
 
     # Parse connection string or use environment
     if not connection_string:
@@ -85,21 +130,17 @@ def setup_tables(connection_string: Optional[str] = None):
 
         # Execute SQL with transaction safety
         with connection.cursor() as cursor:
-            # Split and validate each statement
-            statements = [s.strip() for s in sql_content.split(";") if s.strip()]
-
             for i, statement in enumerate(statements):
-                if statement:
-                    try:
-                        # Log statement execution (without sensitive data)
-                        logger.info(f"Executing statement {i + 1}/{len(statements)}")
-                        cursor.execute(statement)
-                    except PyMySQLError as stmt_error:
-                        logger.error(
-                            f"❌ Failed to execute statement {i + 1}: {stmt_error}"
-                        )
-                        connection.rollback()
-                        return False
+                try:
+                    # Log statement execution (without sensitive data)
+                    logger.info(f"Executing statement {i + 1}/{len(statements)}")
+                    cursor.execute(statement)
+                except PyMySQLError as stmt_error:
+                    logger.error(
+                        f"❌ Failed to execute statement {i + 1}: {stmt_error}"
+                    )
+                    connection.rollback()
+                    return False
 
         # Commit all changes
         connection.commit()
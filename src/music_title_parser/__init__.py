@@ -22,23 +22,63 @@ Example:
 
 from __future__ import annotations
 
-from .models import ParsedTitle, PolicyProfile
-from .parser import parse_title, split_artist_title
+import importlib
+from typing import TYPE_CHECKING, Any
 
-try:
-    from .policy_engine import parse_with_policy
-except Exception:  # Graceful degradation when policy engine is unavailable
+if TYPE_CHECKING:
+    from .models import ParsedTitle, PolicyProfile
+    from .parser import parse_title, parse_titles, split_artist_title
+    from .policy_engine import (
+        parse_titles_with_policy,
+        parse_with_policy,
+        parse_with_policy_cached,
+    )
 
-    def parse_with_policy(*args, **kwargs):  # type: ignore[no-redef]
-        raise ImportError(
-            "music_title_parser.policy_engine is not available in this build"
-        )
+# Public names and the submodule defining each. They are imported on first access,
+# so importing a submodule such as the CLI doesn't load Pydantic and the policy
+# engine up front.
+_LAZY_EXPORTS: dict[str, str] = {
+    "ParsedTitle": ".models",
+    "PolicyProfile": ".models",
+    "parse_title": ".parser",
+    "parse_titles": ".parser",
+    "split_artist_title": ".parser",
+    "parse_titles_with_policy": ".policy_engine",
+    "parse_with_policy": ".policy_engine",
+    "parse_with_policy_cached": ".policy_engine",
+}
+
+
+def _policy_engine_unavailable(*args: Any, **kwargs: Any) -> Any:
+    raise ImportError("music_title_parser.policy_engine is not available in this build")
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        value = getattr(importlib.import_module(module_name, __name__), name)
+    except Exception:
+        if module_name != ".policy_engine":
+            raise
+        # Graceful degradation when policy engine is unavailable
+        value = _policy_engine_unavailable
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_EXPORTS})
 
 
 __version__ = "0.1.0"
 __all__ = [
     "parse_title",
+    "parse_titles",
     "parse_with_policy",
+    "parse_with_policy_cached",
+    "parse_titles_with_policy",
     "split_artist_title",
     "ParsedTitle",
     "PolicyProfile",
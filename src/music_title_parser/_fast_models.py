@@ -0,0 +1,55 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Perday CatalogLAB™
+
+"""Lightweight result records used inside the parsing hot path."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from .models import Decision, ParsedTitle, ParsingMethod, PolicyProfile
+
+
+@dataclass(frozen=True)
+class FastParsedTitle:
+    """
+    Slotted twin of :class:`ParsedTitle` for internal use.
+
+    Converted to the Pydantic model only when a result leaves the public API.
+    """
+
+    __slots__ = (
+        "artist",
+        "confidence",
+        "decision",
+        "features",
+        "parsing_method",
+        "profile_used",
+        "reason",
+        "title",
+        "version",
+    )
+
+    artist: str
+    title: str
+    features: tuple[str, ...]
+    version: str
+    confidence: float
+    decision: Decision
+    reason: str
+    profile_used: PolicyProfile
+    parsing_method: ParsingMethod
+
+    def to_model(self) -> ParsedTitle:
+        """Wrap as a public :class:`ParsedTitle` without re-validating."""
+        return ParsedTitle.model_construct(
+            artist=self.artist,
+            title=self.title,
+            features=self.features,
+            version=self.version,
+            confidence=self.confidence,
+            decision=self.decision,
+            reason=self.reason,
+            profile_used=self.profile_used,
+            parsing_method=self.parsing_method,
+        )
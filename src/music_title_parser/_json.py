@@ -0,0 +1,20 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Perday CatalogLAB™
+
+"""JSON decoding that uses orjson when it is installed."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable
+
+loads: Callable[[bytes | str], Any]
+
+try:  # Optional C JSON parser; the stdlib parser is used when it isn't installed
+    import orjson
+
+    loads = orjson.loads
+except ImportError:  # pragma: no cover - depends on the environment
+    loads = json.loads
+
+__all__ = ["loads"]
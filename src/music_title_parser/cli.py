@@ -5,181 +5,229 @@
 
 from __future__ import annotations
 
+import argparse
+import logging
 import sys
-from typing import NoReturn, cast
+from typing import TYPE_CHECKING, Callable, Final, NoReturn, cast
 
-from .models import ParsedTitle, PolicyProfile
-from .policy_engine import PolicyEngine, parse_with_policy
+if TYPE_CHECKING:
+    from .models import ParsedTitle, PolicyProfile
 
+logger = logging.getLogger(__name__)
 
-def main() -> NoReturn:
-    """Main CLI entry point."""
-    if len(sys.argv) < 2:
+_REQUIRED_PROFILES: Final[frozenset[PolicyProfile]] = frozenset(
+    {"strict", "balanced", "aggressive"}
+)
+
+# Enough rows for the streaming benchmark to run several 10k - row chunks
+_BENCHMARK_TITLES: Final[int] = 100_000
+
+_HELP: Final[str] = """
+Music Title Parser CLI
+
+Usage:
+  music-title-parser parse <title> [channel] [profile]
+  music-title-parser validate
+  music-title-parser benchmark
+  music-title-parser --help
+
+Commands:
+  parse      Parse a music title with optional channel and profile
+  validate   Validate policy configuration files
+  benchmark  Run performance benchmark
+  --help     Show this help message
+
+Examples:
+  music-title-parser parse "Taylor Swift - Anti-Hero"
+  music-title-parser parse "Anti-Hero" "Taylor Swift - Topic" balanced
+  music-title-parser validate
+  music-title-parser benchmark
+
+Profiles:
+  strict     Highest precision, conservative parsing
+  balanced   Production default with good precision / recall balance
+  aggressive Shadow mode for candidate generation
+
+Install with pipx:
+  pipx install music-title-parser
+
+"""
+
+
+class _ArgumentParser(argparse.ArgumentParser):
+    """Report usage errors with the full help text and exit status 1."""
+
+    def error(self, message: str) -> NoReturn:
+        logger.error("%s", message)
         _show_help()
         sys.exit(1)
 
-    command = sys.argv[1]
 
-    if command == "parse":
-        _parse_command()
-    elif command == "validate":
-        _validate_command()
-    elif command == "benchmark":
-        _benchmark_command()
-    elif command == "--help" or command == "-h":
-        _show_help()
-        sys.exit(0)
-    else:
-        print(f"Unknown command: {command}")
+def _build_parser() -> argparse.ArgumentParser:
+    parser = _ArgumentParser(prog="music-title-parser", add_help=False)
+    parser.add_argument("-h", "--help", action="store_true")
+    subcommands = parser.add_subparsers(dest="command")
+
+    parse = subcommands.add_parser("parse", add_help=False)
+    parse.add_argument("title")
+    parse.add_argument("channel", nargs="?", default="")
+    parse.add_argument("profile", nargs="?", default="balanced")
+
+    subcommands.add_parser("validate", add_help=False)
+    subcommands.add_parser("benchmark", add_help=False)
+    return parser
+
+
+_PARSER: Final = _build_parser()
+
+
+def _parse_argv(argv: list[str]) -> argparse.Namespace:
+    if argv[:1] == ["parse"]:
+        # Everything after "parse" is positional, so titles and channels may
+        # start with "-" (e.g. "-Intro")
+        argv = ["parse", "--", *argv[1:]]
+    return _PARSER.parse_args(argv)
+
+
+def main() -> NoReturn:
+    """Main CLI entry point."""
+    _configure_logging()
+    args = _parse_argv(sys.argv[1:])
+
+    if args.help or args.command is None:
         _show_help()
-        sys.exit(1)
+        sys.exit(0 if args.help else 1)
+
+    _COMMANDS[args.command](args)
 
 
 def validate_policy() -> NoReturn:
     """CLI entry point for policy validation."""
+    _configure_logging()
     try:
         result = _validate_policy_files()
         if result:
             print("✅ Policy validation passed")
             sys.exit(0)
         else:
-            print("❌ Policy validation failed")
+            logger.error("❌ Policy validation failed")
             sys.exit(1)
     except Exception as e:
-        print(f"❌ Validation error: {e}")
+        logger.error("❌ Validation error: %s", e)
         sys.exit(1)
 
 
-def _parse_command() -> None:
+def _configure_logging() -> None:
+    # Diagnostics go to stderr through logging; results stay on stdout
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+
+def _parse_command(args: argparse.Namespace) -> None:
     """Handle parse command."""
-    if len(sys.argv) < 3:
-        print("Usage: music-title-parser parse <title> [channel] [profile]")
-        sys.exit(1)
+    from .policy_engine import parse_with_policy
 
-    title = sys.argv[2]
-    channel = sys.argv[3] if len(sys.argv) > 3 else ""
-    profile = sys.argv[4] if len(sys.argv) > 4 else "balanced"
+    title = args.title
+    channel = args.channel
+    profile = args.profile
 
-    if profile not in ["strict", "balanced", "aggressive"]:
-        print(f"Invalid profile: {profile}. Use: strict, balanced, aggressive")
+    if profile not in _REQUIRED_PROFILES:
+        logger.error("Invalid profile: %s. Use: strict, balanced, aggressive", profile)
         sys.exit(1)
 
     try:
-        typed_profile = cast(PolicyProfile, profile)
+        typed_profile = cast("PolicyProfile", profile)
         result = parse_with_policy(title, channel, typed_profile)
         _print_result(result)
     except Exception as e:
-        print(f"❌ Parsing failed: {e}")
+        logger.error("❌ Parsing failed: %s", e)
         sys.exit(1)
 
 
-def _validate_command() -> None:
+def _validate_command(args: argparse.Namespace) -> None:
     """Handle validate command."""
     try:
         if _validate_policy_files():
             print("✅ All policy files are valid")
         else:
-            print("❌ Policy validation failed")
+            logger.error("❌ Policy validation failed")
             sys.exit(1)
     except Exception as e:
-        print(f"❌ Validation error: {e}")
+        logger.error("❌ Validation error: %s", e)
         sys.exit(1)
 
 
-def _benchmark_command() -> None:
+def _benchmark_command(args: argparse.Namespace) -> None:
     """Handle benchmark command."""
     try:
         from .benchmarks import run_basic_benchmark
 
         print("🚀 Running benchmark...")
-        result = run_basic_benchmark()
-        print(
-            f"✅ Processed {result.rows_processed} titles in {result.time_seconds:.3f}s"
+        result = run_basic_benchmark(num_titles=_BENCHMARK_TITLES, stream=True)
+        sys.stdout.write(
+            f"✅ Processed {result.rows_processed} titles in {result.time_seconds:.3f}s\n"
+            f"📊 Rate: {result.rows_per_second:,} titles / second"
+            " (engine records, excluding ParsedTitle wrapping)\n"
+            f"💾 Memory: {result.memory_mb:.1f} MB (peak RSS {result.peak_rss_mb:.1f} MB)\n"
         )
-        print(f"📊 Rate: {result.rows_per_second:,} titles / second")
-        print(f"💾 Memory: {result.memory_mb:.1f} MB")
     except ImportError:
-        print("❌ Benchmark module not available")
+        logger.error("❌ Benchmark module not available")
         sys.exit(1)
     except Exception as e:
-        print(f"❌ Benchmark failed: {e}")
+        logger.error("❌ Benchmark failed: %s", e)
         sys.exit(1)
 
 
+_COMMANDS: dict[str, Callable[[argparse.Namespace], None]] = {
+    "parse": _parse_command,
+    "validate": _validate_command,
+    "benchmark": _benchmark_command,
+}
+
+
 def _validate_policy_files() -> bool:
     """Validate policy configuration files."""
+    from .policy_engine import get_policy_engine
+
     try:
-        engine = PolicyEngine()
+        # Process-wide singleton: the policy and list files load once per process
+        engine = get_policy_engine()
 
-        required_profiles: tuple[PolicyProfile, ...] = (
-            "strict",
-            "balanced",
-            "aggressive",
-        )
-        for profile_name in required_profiles:
+        for profile_name in _REQUIRED_PROFILES:
             engine.policy.get_profile(profile_name)
 
         allowlist_count = len(engine.allowlist)
         denylist_count = len(engine.denylist)
 
-        print(f"✅ Policy loaded: {len(engine.policy.profiles)} profiles")
-        print(f"✅ Allowlist: {allowlist_count} entries")
-        print(f"✅ Denylist: {denylist_count} entries")
+        sys.stdout.write(
+            f"✅ Policy loaded: {len(engine.policy.profiles)} profiles\n"
+            f"✅ Allowlist: {allowlist_count} entries\n"
+            f"✅ Denylist: {denylist_count} entries\n"
+        )
 
         return True
 
     except Exception as e:
-        print(f"❌ Policy validation failed: {e}")
+        logger.error("❌ Policy validation failed: %s", e)
         return False
 
 
 def _print_result(result: ParsedTitle) -> None:
     """Print parsing result in a nice format."""
-    print(f"🎵 Title: '{result.title}'")
-    print(f"🎤 Artist: '{result.artist}'")
+    lines = [f"🎵 Title: '{result.title}'", f"🎤 Artist: '{result.artist}'"]
     if result.features:
-        print(f"🤝 Features: {', '.join(result.features)}")
+        lines.append(f"🤝 Features: {', '.join(result.features)}")
     if result.version != "Original":
-        print(f"🎛️  Version: {result.version}")
-    print(f"📊 Confidence: {result.confidence:.2f}")
-    print(f"⚖️  Decision: {result.decision}")
-    print(f"🔍 Profile: {result.profile_used}")
-    print(f"💭 Reason: {result.reason}")
+        lines.append(f"🎛️  Version: {result.version}")
+    lines.append(f"📊 Confidence: {result.confidence:.2f}")
+    lines.append(f"⚖️  Decision: {result.decision}")
+    lines.append(f"🔍 Profile: {result.profile_used}")
+    lines.append(f"💭 Reason: {result.reason}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def _show_help() -> None:
     """Show CLI help."""
-    print(
-        """
-Music Title Parser CLI
-
-Usage:
-  music-title-parser parse <title> [channel] [profile]
-  music-title-parser validate
-  music-title-parser benchmark
-  music-title-parser --help
-
-Commands:
-  parse      Parse a music title with optional channel and profile
-  validate   Validate policy configuration files
-  benchmark  Run performance benchmark
-  --help     Show this help message
-
-Examples:
-  music-title-parser parse "Taylor Swift - Anti-Hero"
-  music-title-parser parse "Anti-Hero" "Taylor Swift - Topic" balanced
-  music-title-parser validate
-  music-title-parser benchmark
-
-Profiles:
-  strict     Highest precision, conservative parsing
-  balanced   Production default with good precision / recall balance
-  aggressive Shadow mode for candidate generation
-
-Install with pipx:
-  pipx install music-title-parser
-"""
-    )
+    sys.stdout.write(_HELP)
 
 
 if __name__ == "__main__":
@@ -9,6 +9,7 @@ This module provides Pydantic models for type - safe parsing results and configu
 
 from __future__ import annotations
 
+from enum import IntEnum
 from typing import Final, Literal, NewType
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -30,6 +31,22 @@ ParsingMethod = Literal[
     "stage_b_recovery",
 ]
 
+
+class DecisionCode(IntEnum):
+    """Integer form of :data:`Decision`, ordered from least to most trusted."""
+
+    REJECT = 0
+    GRAYLIST = 1
+    ACCEPT = 2
+
+
+# Decision labels indexed by DecisionCode
+DECISION_NAMES: Final[tuple[Decision, Decision, Decision]] = (
+    "reject",
+    "graylist",
+    "accept",
+)
+
 # Constants
 DEFAULT_CONFIDENCE_THRESHOLD: Final[float] = 0.7
 MAX_COMPLEXITY_THRESHOLD: Final[int] = 10
@@ -46,7 +63,7 @@ class ParsedTitle(BaseModel):
     model_config = ConfigDict(
         frozen=True,  # Immutable result
         str_strip_whitespace=True,
-        validate_assignment=True,
+        extra="forbid",
     )
 
     artist: str = Field(
@@ -58,9 +75,9 @@ class ParsedTitle(BaseModel):
         description="Clean song title",
         examples=["Anti - Hero", "God's Plan", "Song Title"],
     )
-    features: list[str] = Field(
-        default_factory=list,
-        description="List of featured artists",
+    features: tuple[str, ...] = Field(
+        default=(),
+        description="Featured artists, in order of appearance",
         examples=[["Kendrick Lamar"], ["Artist A", "Artist B"], []],
     )
     version: str = Field(
@@ -99,7 +116,7 @@ class ParsedTitle(BaseModel):
 class PolicyConfig(BaseModel):
     """Configuration for a policy profile."""
 
-    model_config = ConfigDict(validate_assignment=True)
+    model_config = ConfigDict(frozen=True)
 
     accept_min: float = Field(
         ge=0.0,
@@ -139,7 +156,7 @@ class PolicyConfig(BaseModel):
 class AllowlistEntry(BaseModel):
     """Entry in the allowlist for trusted mappings."""
 
-    model_config = ConfigDict(validate_assignment=True)
+    model_config = ConfigDict(frozen=True)
 
     pattern_or_mapping: dict[str, str] = Field(
         description="Channel to artist mapping or pattern",
@@ -179,7 +196,7 @@ class AllowlistEntry(BaseModel):
 class DenylistEntry(BaseModel):
     """Entry in the denylist for garbage patterns."""
 
-    model_config = ConfigDict(validate_assignment=True)
+    model_config = ConfigDict(frozen=True)
 
     pattern_or_mapping: dict[str, str] = Field(
         description="Pattern to match or exact string to block",
@@ -256,6 +273,9 @@ class BenchmarkResult(BaseModel):
     rows_processed: int = Field(ge=0, description="Number of rows processed")
     time_seconds: float = Field(ge=0.0, description="Execution time in seconds")
     memory_mb: float = Field(ge=0.0, description="Memory usage in MB")
+    peak_rss_mb: float = Field(
+        default=0.0, ge=0.0, description="Peak process RSS in MB (0 if not measured)"
+    )
     rows_per_second: int = Field(ge=0, description="Processing rate")
     accuracy_score: float = Field(ge=0.0, le=1.0, description="Accuracy score")
     metadata: dict[str, str | int | float] = Field(
@@ -10,11 +10,18 @@ from the original Perday Catalog codebase.
 
 from __future__ import annotations
 
+import functools
 import re
-from typing import Any
+import sys
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping
 
 __all__ = [
+    "CompiledVersionTable",
+    "compile_version_table",
     "parse_title",
+    "parse_titles",
     "split_artist_title",
     "normalize_channel_title_for_artist",
 ]
@@ -36,44 +43,79 @@ _YT_NOISE_RE = re.compile(
 )
 
 
+# Creator - format version synonyms in priority order (first listed wins when a
+# phrase contains several). Compiled into a single regex so matching runs in one
+# C-level call rather than a Python loop over separately compiled patterns; the
+# engine still rescans the phrase for each lookahead until one succeeds.
+_VERSION_SYNONYMS: tuple[tuple[str, str], ...] = (
+    (r"\bsped[-\s]*up\b", "Sped Up"),
+    (r"\bslowed\b", "Slowed"),
+    (r"\bnightcore\b", "Nightcore"),
+    (r"\bclean\b", "Clean"),
+    (r"\bexplicit\b", "Explicit"),
+    (r"\binstrumental\b", "Instrumental"),
+    (r"\bradio\s * edit\b", "Radio Edit"),
+    (r"\bclub\s * mix\b", "Club Mix"),
+    (r"\bvip\b", "VIP"),
+    (r"\bremaster(?:ed)?\b", "Remastered"),
+    (r"\bremix\b", "Remix"),
+    (r"\bacoustic\b", "Acoustic"),
+    (r"\blive\s*version\b", "Live Version"),
+    (r"\blive\s*performance\b", "Live Performance"),
+    (r"\blive\b", "Live"),
+    (r"\bversion\b", "Version"),
+    (r"\brework\b", "Rework"),
+    (r"\bbootleg\b", "Bootleg"),
+    (r"\bcover\b", "Cover"),
+)
+# One lookahead per synonym, tried in priority order from the start of the
+# phrase: the first alternative whose token occurs anywhere wins, and its group
+# name keys the label.
+_VERSION_SYNONYM_RE = re.compile(
+    "|".join(
+        f"(?=.*?(?P<v{idx}>{pattern}))"
+        for idx, (pattern, _) in enumerate(_VERSION_SYNONYMS)
+    ),
+    re.IGNORECASE | re.DOTALL,
+)
+_VERSION_SYNONYM_LABELS: dict[str, str] = {
+    f"v{idx}": label for idx, (_, label) in enumerate(_VERSION_SYNONYMS)
+}
+
+
+_MULTI_SPACE_RE = re.compile(r"\s{2,}")
+
+# Robust: slowedxreverb / slowed + reverb / slowed & reverb / slowed reverb / reverbed + slowed
+_SLOWED_REVERB_RE = re.compile(
+    r"slowed\s*(?:[+x&]|and)?\s*reverb(?:ed)?|reverb(?:ed)?\s*(?:[+x&]|and)?\s*slowed",
+    re.IGNORECASE,
+)
+
+
 # Normalize popular creator - format "versions" to the canonical form we want in DB
-def _normalize_version_phrase(s: str) -> str:
-    """Map common creator variants to canonical version strings."""
-    raw = re.sub(r"\s{2,}", " ", s).strip()
-
-    # Robust: slowedxreverb / slowed + reverb / slowed & reverb / slowed reverb / reverbed + slowed
-    if re.search(
-        r"slowed\s*(?:[+x&]|and)?\s*reverb(?:ed)?|reverb(?:ed)?\s*(?:[+x&]|and)?\s*slowed",
-        raw,
-        re.IGNORECASE,
-    ):
+def _normalize_version_phrase(s: str, kind: str | None = None) -> str:
+    """Map common creator variants to canonical version strings.
+
+    ``kind="slowed_reverb"`` means the caller already matched the segment
+    slowed / reverb gate, whose matches this function always maps to
+    "Slowed and Reverbed", so the phrase isn't scanned again.
+    """
+    if kind == "slowed_reverb":
         return "Slowed and Reverbed"
 
-    # Canonicalize simple variants
-    synonyms = {
-        r"\bsped[-\s]*up\b": "Sped Up",
-        r"\bslowed\b": "Slowed",
-        r"\bnightcore\b": "Nightcore",
-        r"\bclean\b": "Clean",
-        r"\bexplicit\b": "Explicit",
-        r"\binstrumental\b": "Instrumental",
-        r"\bradio\s * edit\b": "Radio Edit",
-        r"\bclub\s * mix\b": "Club Mix",
-        r"\bvip\b": "VIP",
-        r"\bremaster(?:ed)?\b": "Remastered",
-        r"\bremix\b": "Remix",
-        r"\bacoustic\b": "Acoustic",
-        r"\blive\s*version\b": "Live Version",
-        r"\blive\s*performance\b": "Live Performance",
-        r"\blive\b": "Live",
-        r"\bversion\b": "Version",
-        r"\brework\b": "Rework",
-        r"\bbootleg\b": "Bootleg",
-        r"\bcover\b": "Cover",
-    }
-    for pat, out in synonyms.items():
-        if re.search(pat, raw, re.IGNORECASE):
-            return out
+    # Every check below is whitespace - agnostic, so fold all whitespace to single spaces
+    raw = " ".join(s.split())
+    canonical = _CANONICAL_PHRASES.get(raw)
+    if canonical is not None:
+        return canonical
+
+    if _SLOWED_REVERB_RE.search(raw):
+        return "Slowed and Reverbed"
+
+    # Canonicalize simple variants: the highest - priority synonym present wins
+    m = _VERSION_SYNONYM_RE.match(raw)
+    if m:
+        return _VERSION_SYNONYM_LABELS[m.lastgroup]  # type: ignore[index]
 
     # Gentle smart - cap fallback (don't wreck acronyms)
     return " ".join(
@@ -117,54 +159,103 @@ _VERSION_KEYWORDS = (
 )
 
 
+# Version gates for paren / bracket segments, compiled once at import.
+_SEGMENT_SLOWED_REVERB_RE = re.compile(
+    r"slowed\s*(?:[+x&]|and)?\s * reverb(?:ed)?|reverb(?:ed)?\s*(?:[+x&]|and)?\s * slowed",
+    re.IGNORECASE,
+)
+_VERSION_CONTENT_KEYWORDS = (
+    "live",
+    "acoustic",
+    "remix",
+    "remastered",
+    "edit",
+    "version",
+    "instrumental",
+    "demo",
+    "clean",
+    "explicit",
+    "chopped and screwed",
+    "sped up",
+    "slowed",
+    "nightcore",
+    "extended",
+    "club mix",
+    "vip",
+    "rework",
+    "bootleg",
+    "cover",
+)
+
+
+def _keyword_trie_pattern(words: tuple[str, ...]) -> str:
+    """Build a regex alternation for ``words`` factored by shared prefixes.
+
+    ``remix|remastered|rework`` becomes ``re(?:m(?:astered|ix)|work)``, so the
+    engine tests each prefix once instead of once per keyword. It matches the
+    same strings as the flat alternation.
+    """
+    trie: dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def emit(node: dict[str, Any]) -> str:
+        branches = [re.escape(ch) + emit(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f"(?:{body})?" if "" in node else body
+
+    return emit(trie)
+
+
+_VERSION_CONTENT_RE = re.compile(
+    rf"\b{_keyword_trie_pattern(_VERSION_CONTENT_KEYWORDS)}\b",
+    re.IGNORECASE,
+)
+
+
+# Name separators: commas, ampersand, 'and', 'x', slash, multiplication sign, literal plus
+_NAME_SPLIT_RE = re.compile(
+    r"\s*(?:,|&|and|/|×|\+|(?<=\w)\s*[xX]\s*(?=\w))\s*",
+    re.IGNORECASE,
+)
+# Every separator above contains one of these characters or the letters "and"
+_NAME_SEPARATOR_CHARS = frozenset(",&/×+xX")
+
+
+def _split_names(s: str) -> list[str]:
+    """Split on name separators, skipping the regex when none can be present."""
+    if _NAME_SEPARATOR_CHARS.isdisjoint(s) and "and" not in s.lower():
+        return [s]
+    return _NAME_SPLIT_RE.split(s)
+
+
 def _split_guests(guests: str) -> list[str]:
-    # commas, ampersand, 'and', 'x', slash, multiplication sign, literal plus
-    parts = re.split(
-        r"\s*(?:,|&|and|/|×|\+|(?<=\w)\s*[xX]\s*(?=\w))\s*",
-        guests,
-        flags=re.IGNORECASE,
-    )
+    parts = _split_names(guests)
     out: list[str] = []
     seen = set()
     for p in parts:
         name = p.strip()
-        if not name or name.lower() in seen:
+        if not name:
+            continue
+        key = name.lower()
+        if key in seen:
             continue
         out.append(name)
-        seen.add(name.lower())
+        seen.add(key)
     return out
 
 
-def _is_version_content(content: str) -> bool:
-    """Heuristic: looks like a version tag (Live, Acoustic, Remix, Slowed / Reverb, etc.)."""
-    if _FEATURE_PREFIX.match(content):
-        return False
-    seg = content.strip()
-    # Treat 'slowed x reverb' (and +, &, 'and', or just whitespace) as a version in any order.
-    if re.search(
-        r"slowed\s*(?:[+x&]|and)?\s * reverb(?:ed)?|reverb(?:ed)?\s*(?:[+x&]|and)?\s * slowed",
-        seg,
-        re.IGNORECASE,
-    ):
-        return True
-    return bool(
-        re.search(
-            r"\b(?:live|acoustic|remix|remastered|edit|version|instrumental|demo|clean|explicit|chopped and screwed|sped up|slowed|nightcore|extended|club mix|vip|rework|bootleg|cover)\b",
-            seg,
-            flags=re.IGNORECASE,
-        )
-    )
-
-
-def _get_default_version_mapping_table() -> dict[str, str]:
-    """
-    Simple lookup table for version combinations.
-    Key: sorted combination of versions (e.g., "acoustic + official video")
-    Value: the result version to use
-
-    This is much simpler than complex priority rules!
-    """
-    return {
+# Simple lookup table for version combinations.
+# Key: combination of versions (e.g., "acoustic + official video"), any order
+# Value: the result version to use
+# This is much simpler than complex priority rules!
+_DEFAULT_VERSION_TABLE: Mapping[str, str] = MappingProxyType(
+    {
         # Single versions (normalize names)
         "visualizer": "lyric video",
         "lyric visualizer": "lyric video",
@@ -199,6 +290,31 @@ def _get_default_version_mapping_table() -> dict[str, str]:
         # Three or more versions - just take the first musical one
         # (These are rare, but the logic will handle them)
     }
+)
+
+
+# Every version label the parser emits on its own, interned so results that share a
+# version also share one string object. Table results are emitted title - cased.
+_CANONICAL_VERSIONS: dict[str, str] = {
+    label: sys.intern(label)
+    for label in (
+        "Original",
+        "Slowed and Reverbed",
+        "Lyric Video",
+        *(out for _, out in _VERSION_SYNONYMS),
+        *(result.title() for result in _DEFAULT_VERSION_TABLE.values()),
+    )
+}
+
+# Canonical labels that normalize to themselves, letting _normalize_version_phrase
+# return already - canonical input without scanning it. Filled after the fact since
+# membership is decided by running the full normalization on each label.
+_CANONICAL_PHRASES: dict[str, str] = {}
+_CANONICAL_PHRASES.update(
+    (label, interned)
+    for label, interned in _CANONICAL_VERSIONS.items()
+    if _normalize_version_phrase(label) == label
+)
 
 
 def _get_default_version_mapping_rules() -> dict[str, Any]:
@@ -231,6 +347,9 @@ def _get_default_version_mapping_rules() -> dict[str, Any]:
     }
 
 
+_PRIORITY_SLOWED_REVERB_RE = re.compile(r"slowed\s*(?:[+x&]|and)?\s * reverb")
+
+
 def _get_version_priority(
     version_text: str, rules: dict[str, Any] | None = None
 ) -> int:
@@ -250,15 +369,56 @@ def _get_version_priority(
             return priority
 
     # Fallback to pattern matching for complex cases
-    if re.search(r"slowed\s*(?:[+x&]|and)?\s * reverb", version_lower):
+    if _PRIORITY_SLOWED_REVERB_RE.search(version_lower):
         return priorities.get("slowed and reverbed", 1)
 
     # Default priority for unknown versions
     return 6
 
 
+@dataclass(frozen=True)
+class CompiledVersionTable:
+    """
+    Version mapping table pre-split for lookup.
+
+    ``aliases`` maps a lower - cased version to its result; ``combinations`` maps
+    the set of lower - cased parts of a "a + b" key to its result, so lookups no
+    longer depend on how the key was spaced or ordered.
+    """
+
+    aliases: Mapping[str, str]
+    combinations: Mapping[frozenset[str], str]
+
+
+def compile_version_table(table: Mapping[str, str]) -> CompiledVersionTable:
+    """
+    Precompute lookup structures for a version mapping table.
+
+    Pass the result to ``parse_title(..., version_mapping_table=...)`` when the
+    same table is reused across many titles.
+
+    Example:
+        >>> compiled = compile_version_table({"slowed + visualizer": "slowed"})
+        >>> compiled.combinations[frozenset({"slowed", "visualizer"})]
+        'slowed'
+    """
+    aliases: dict[str, str] = {}
+    combinations: dict[frozenset[str], str] = {}
+    for key, result in table.items():
+        lowered = key.strip().lower()
+        aliases[lowered] = result
+        if "+" in lowered:
+            parts = frozenset(p.strip() for p in lowered.split("+") if p.strip())
+            combinations[parts] = result
+    return CompiledVersionTable(aliases=aliases, combinations=combinations)
+
+
+_DEFAULT_COMPILED_TABLE = compile_version_table(_DEFAULT_VERSION_TABLE)
+
+
 def _resolve_version_combination(
-    versions: list[str], version_table: dict[str, str] | None = None
+    versions: list[str],
+    version_table: Mapping[str, str] | CompiledVersionTable | None = None,
 ) -> str:
     """
     Resolve version combinations using a simple lookup table.
@@ -268,33 +428,58 @@ def _resolve_version_combination(
         return "Original"
 
     if len(versions) == 1:
-        single_version = versions[0].lower()
         # Check if single version needs normalization
-        if version_table and single_version in version_table:
-            return version_table[single_version].title()
+        if isinstance(version_table, CompiledVersionTable):
+            version_table = version_table.aliases
+        if version_table:
+            result = version_table.get(versions[0].lower())
+            if result is not None:
+                return result.title()
         return versions[0]
 
-    if version_table is None:
-        version_table = _get_default_version_mapping_table()
+    # Lower - case once; the same keys serve the combination and single lookups
+    lowered = [v.lower() for v in versions]
 
-    # Create a sorted key for lookup (consistent ordering)
-    version_key = "+".join(sorted([v.lower() for v in versions]))
+    if version_table is None:
+        compiled = _DEFAULT_COMPILED_TABLE
+    elif isinstance(version_table, CompiledVersionTable):
+        compiled = version_table
+    else:
+        # Raw tables are probed directly instead of re - indexed on every call: the
+        # sorted "a+b" form VersionRuleManager writes, and "a + b" in sorted or
+        # title order as the docs show.
+        ordered = sorted(lowered)
+        for key in ("+".join(ordered), " + ".join(ordered), " + ".join(lowered)):
+            result = version_table.get(key)
+            if result is not None:
+                return result.title()
+        for single_key in lowered:
+            result = version_table.get(single_key)
+            if result is not None:
+                return result.title()
+        return versions[0]
 
-    # Direct lookup in the table
-    if version_key in version_table:
-        return version_table[version_key].title()
+    # Direct lookup in the table, keyed order - independently
+    result = compiled.combinations.get(frozenset(lowered))
+    if result is not None:
+        return result.title()
 
     # If no exact match, try individual versions first (single version normalization)
-    for version in versions:
-        single_key = version.lower()
-        if single_key in version_table:
-            return version_table[single_key].title()
+    aliases = compiled.aliases
+    for single_key in lowered:
+        result = aliases.get(single_key)
+        if result is not None:
+            return result.title()
 
     # Fallback: return the first version if no rules match
     # This handles cases not covered by the table
     return versions[0]
 
 
+_BRACKET_CHARS_RE = re.compile(r"[()\[\]{}]")
+_CLOSING_BRACKET = {"(": ")", "[": "]", "{": "}"}
+
+
 def _strip_paren_segments(full_title: str) -> tuple[str, list[str]]:
     """
     Return (base_without_segments, [segments…]) scanning (), [], {} left→right.
@@ -302,53 +487,36 @@ def _strip_paren_segments(full_title: str) -> tuple[str, list[str]]:
     """
     segments: list[str] = []
     keep: list[str] = []
-    i = 0
-
-    while i < len(full_title):
-        # Find opening bracket
-        start_pos = None
-        bracket_type = None
-
-        for pos in range(i, len(full_title)):
-            if full_title[pos] in "([{":
-                start_pos = pos
-                bracket_type = full_title[pos]
-                break
-
-        if start_pos is None:
-            # No more brackets, add rest of string
-            keep.append(full_title[i:].strip())
-            break
-
-        # Add text before bracket
-        keep.append(full_title[i:start_pos].strip())
-
-        # Find matching closing bracket
-        close_map = {"(": ")", "[": "]", "{": "}"}
-        target_close = close_map[bracket_type]
-        depth = 0
-        end_pos = None
-
-        for pos in range(start_pos, len(full_title)):
-            if full_title[pos] == bracket_type:
-                depth += 1
-            elif full_title[pos] == target_close:
-                depth -= 1
-                if depth == 0:
-                    end_pos = pos
-                    break
-
-        if end_pos is not None:
-            # Extract content between brackets (excluding the brackets themselves)
-            content = full_title[start_pos + 1 : end_pos].strip()
-            segments.append(content)
-            i = end_pos + 1
-        else:
-            # Unmatched bracket, treat as regular text
-            keep.append(full_title[start_pos:].strip())
-            break
-
-    base = re.sub(r"\s{2,}", " ", " ".join(k for k in keep if k)).strip()
+    last = 0  # end of the most recent closed segment
+    start = 0  # position of the open outermost bracket
+    opener = closer = ""
+    depth = 0
+
+    # Single pass over bracket characters only; at depth 0 an opener starts a
+    # segment, inside one only its own bracket type counts toward nesting.
+    for m in _BRACKET_CHARS_RE.finditer(full_title):
+        ch = m.group()
+        if depth == 0:
+            if ch in _CLOSING_BRACKET:
+                start = m.start()
+                keep.append(full_title[last:start].strip())
+                opener, closer = ch, _CLOSING_BRACKET[ch]
+                depth = 1
+        elif ch == opener:
+            depth += 1
+        elif ch == closer:
+            depth -= 1
+            if depth == 0:
+                segments.append(full_title[start + 1 : m.start()].strip())
+                last = m.end()
+
+    if depth:
+        # Unmatched bracket, treat it and the rest as regular text
+        keep.append(full_title[start:].strip())
+    else:
+        keep.append(full_title[last:].strip())
+
+    base = _MULTI_SPACE_RE.sub(" ", " ".join(k for k in keep if k)).strip()
     return base, segments
 
 
@@ -361,6 +529,20 @@ def _smart_cap(s: str) -> str:
     return " ".join(out)
 
 
+def _find_spaced_dash(s: str) -> int:
+    """Index of the first hyphen / en dash / em dash with whitespace on both sides, else -1."""
+    best = -1
+    last = len(s) - 1
+    for dash in "-–—":
+        i = s.find(dash, 1)
+        while i != -1 and (best == -1 or i < best):
+            if i < last and s[i - 1].isspace() and s[i + 1].isspace():
+                best = i
+                break
+            i = s.find(dash, i + 1)
+    return best
+
+
 def split_artist_title(full: str) -> tuple[list[str], str]:
     """
     Split strings like "Artist A & Artist B - Song Title (...)" into (["Artist A","Artist B"], "Song Title (...)").
@@ -389,19 +571,15 @@ def split_artist_title(full: str) -> tuple[list[str], str]:
     s = full.strip()
 
     # Split on " - " (or – / —) once
-    parts = re.split(r"\s[-–—]\s", s, maxsplit=1)
-    if len(parts) != 2:
+    dash = _find_spaced_dash(s)
+    if dash == -1:
         return [], s
 
-    left, right = parts[0].strip(), parts[1].strip()
+    left, right = s[: dash - 1].strip(), s[dash + 2 :].strip()
 
     # Split left into primary artists; include '/' but be careful with names like 'AC / DC'
     # Use word boundaries to avoid splitting names that contain these characters
-    raw_artists = re.split(
-        r"\s*(?:,|&|and|/|×|\+|(?<=\w)\s*[xX]\s*(?=\w))\s*",
-        left,
-        flags=re.IGNORECASE,
-    )
+    raw_artists = _split_names(left)
 
     artists: list[str] = []
     seen = set()
@@ -418,11 +596,33 @@ def split_artist_title(full: str) -> tuple[list[str], str]:
     return artists, right
 
 
+# parse_title patterns, compiled once at import.
+_PRODUCED_BY_TAIL_RE = re.compile(r"\s * produced\s + by\s+.+$", re.IGNORECASE)
+_PRODUCED_BY_SEGMENT_RE = re.compile(r"^produced\s + by\s+.+$", re.IGNORECASE)
+_TAIL_FEATURE_PATTERNS = (
+    # After dash
+    re.compile(
+        r"[-–—]\s*(?:feat\.?|featuring|ft\.?|with)\s+(?P<guests>.+)$", re.IGNORECASE
+    ),
+    # Standalone
+    re.compile(r"\s+(?:feat\.?|featuring|ft\.?|with)\s+(?P<guests>.+)$", re.IGNORECASE),
+)
+_LYRIC_HINT_RE = re.compile(r"\blyric(s)?\b|visuali[zs]er", re.IGNORECASE)
+
+# Bound matchers for the per-segment loop in parse_title, saving an attribute
+# lookup on every call.
+_match_yt_noise = _YT_NOISE_RE.match
+_match_produced_by_segment = _PRODUCED_BY_SEGMENT_RE.match
+_match_feature_prefix = _FEATURE_PREFIX.match
+_search_slowed_reverb = _SEGMENT_SLOWED_REVERB_RE.search
+_search_version_keyword = _VERSION_CONTENT_RE.search
+
+
 def parse_title(
     title: str,
     *,
     normalize_youtube_noise: bool = False,  # <— toggle (default off)
-    version_mapping_table: dict[str, str] | None = None,  # <— simple table approach
+    version_mapping_table: Mapping[str, str] | CompiledVersionTable | None = None,
 ) -> dict[str, Any]:
     """
     Parse music titles with comprehensive feature and version detection.
@@ -440,7 +640,9 @@ def parse_title(
         normalize_youtube_noise: If True, filter out YouTube presentation labels
         version_mapping_table: Optional dict for custom version handling. Simple key - value pairs:
             - Single versions: "visualizer": "lyric video" (normalize names)
-            - Combinations: "slowed + visualizer": "slowed" (sorted keys)
+            - Combinations: "slowed + visualizer": "slowed" (sorted or title order)
+            Pass ``compile_version_table(table)`` instead to match combination keys
+            in any order and spacing.
 
     Returns:
         Dictionary with parsed components:
@@ -477,27 +679,77 @@ def parse_title(
     if not isinstance(title, str) or not title.strip():
         raise ValueError("title must be a non - empty string")
 
+    # Results for the default table are memoized; custom tables are rare and may
+    # be mutable, so they always take the uncached path.
+    if version_mapping_table is None:
+        base, features, version = _parse_title_cached(title, normalize_youtube_noise)
+    else:
+        base, features, version = _parse_title_parts(
+            title, normalize_youtube_noise, version_mapping_table
+        )
+
+    return {
+        "artist": "",
+        "title": base,
+        "features": list(features),
+        "version": version,
+    }
+
+
+def parse_titles(
+    titles: Iterable[str],
+    *,
+    normalize_youtube_noise: bool = False,
+    version_mapping_table: Mapping[str, str] | CompiledVersionTable | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Parse many titles at once; equivalent to calling ``parse_title`` on each.
+
+    Raises:
+        ValueError: If any title is empty or not a string
+    """
+    results: list[dict[str, Any]] = []
+    append = results.append
+    for title in titles:
+        if not isinstance(title, str) or not title.strip():
+            raise ValueError("title must be a non - empty string")
+        if version_mapping_table is None:
+            base, features, version = _parse_title_cached(title, normalize_youtube_noise)
+        else:
+            base, features, version = _parse_title_parts(
+                title, normalize_youtube_noise, version_mapping_table
+            )
+        append({"artist": "", "title": base, "features": list(features), "version": version})
+    return results
+
+
+def _parse_title_parts(
+    title: str,
+    normalize_youtube_noise: bool,
+    version_mapping_table: Mapping[str, str] | CompiledVersionTable | None,
+) -> tuple[str, tuple[str, ...], str]:
+    """Parse a validated title into ``(title, features, version)``."""
     base, segments = _strip_paren_segments(title)
 
     # Strip trailing producer attributions from the base string when normalizing
     # e.g., "... Produced by IVN" → remove
     if normalize_youtube_noise:
-        base = re.sub(
-            r"\s * produced\s + by\s+.+$", "", base, flags=re.IGNORECASE
-        ).strip()
+        base = _PRODUCED_BY_TAIL_RE.sub("", base).strip()
+        # Drop YouTube presentation labels and producer attribution segments
+        # up front so the segment loop below has no per - segment toggle check
+        segments = [
+            content
+            for content in segments
+            if not (_match_yt_noise(content) or _match_produced_by_segment(content))
+        ]
 
     features: list[str] = []
     version: str | None = None
 
     # Handle " - feat. X" and " feat. X" outside parentheses / brackets.
     # Look for features after dash or just standalone
-    feature_patterns = [
-        r"[-–—]\s*(?:feat\.?|featuring|ft\.?|with)\s+(?P<guests>.+)$",  # After dash
-        r"\s+(?:feat\.?|featuring|ft\.?|with)\s+(?P<guests>.+)$",  # Standalone
-    ]
-
-    for pattern in feature_patterns:
-        dash = re.search(pattern, base, re.IGNORECASE)
+    for pattern in _TAIL_FEATURE_PATTERNS:
+        dash = pattern.search(base)
         if dash:
             features.extend(_split_guests(dash.group("guests")))
             base = base[: dash.start()].strip()
@@ -506,26 +758,21 @@ def parse_title(
     # Walk paren / bracket contents in order: collect features and find version tags.
     version_candidates = []
 
+    # Segments come back already stripped, so they are matched as - is.
     for content in segments:
-        # Drop YouTube presentation labels when toggle is on
-        if normalize_youtube_noise and _YT_NOISE_RE.match(content.strip()):
-            continue
-
-        # Drop producer attribution segments entirely when normalizing
-        if normalize_youtube_noise and re.match(
-            r"^produced\s + by\s+.+$", content.strip(), flags=re.IGNORECASE
-        ):
-            continue
-
-        m = _FEATURE_PREFIX.match(content)
+        m = _match_feature_prefix(content)
         if m:
             features.extend(_split_guests(m.group("guests")))
             continue
 
-        if _is_version_content(content):
-            normalized_version = _normalize_version_phrase(content)
-            version_candidates.append(normalized_version)
-            continue
+        # Version tags: 'slowed x reverb' (and +, &, 'and', or just whitespace) in
+        # any order, then the general keyword list
+        if _search_slowed_reverb(content):
+            version_candidates.append(
+                _normalize_version_phrase(content, kind="slowed_reverb")
+            )
+        elif _search_version_keyword(content):
+            version_candidates.append(_normalize_version_phrase(content))
 
     # Resolve multiple versions using simple table lookup
     if version_candidates:
@@ -539,17 +786,19 @@ def parse_title(
     # Heuristic: if title text contains lyric / visualizer tokens, treat as Lyric Video
     # even if the specific token was removed as noise for canonicalization.
     if normalize_youtube_noise and version == "Original":
-        if re.search(r"\blyric(s)?\b", title, flags=re.IGNORECASE) or re.search(
-            r"visuali[zs]er", title, flags=re.IGNORECASE
-        ):
+        if _LYRIC_HINT_RE.search(title):
             version = "Lyric Video"
 
-    return {
-        "artist": "",
-        "title": base,
-        "features": features,
-        "version": version,
-    }
+    version = _CANONICAL_VERSIONS.get(version, version)
+
+    return base, tuple(features), version
+
+
+@functools.lru_cache(maxsize=16384)
+def _parse_title_cached(
+    title: str, normalize_youtube_noise: bool
+) -> tuple[str, tuple[str, ...], str]:
+    return _parse_title_parts(title, normalize_youtube_noise, None)
 
 
 def normalize_channel_title_for_artist(channel_title: str) -> str:
@@ -572,5 +821,8 @@ def normalize_channel_title_for_artist(channel_title: str) -> str:
     if not isinstance(channel_title, str):
         return ""
     out = channel_title.strip()
-    out = re.sub(r"\s*-\s*Topic$", "", out, flags=re.IGNORECASE).strip()
+    if out[-5:].lower() == "topic":
+        head = out[:-5].rstrip()
+        if head.endswith("-"):
+            out = head[:-1].strip()
     return out
@@ -5,12 +5,16 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import re
+import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Sequence
 
+from ._fast_models import FastParsedTitle
+from ._json import loads as _json_loads
 from .exceptions import (
     ConfigLoadError,
     InvalidPatternError,
@@ -18,13 +22,16 @@ from .exceptions import (
     ValidationError,
 )
 from .models import (
+    DECISION_NAMES,
     DEFAULT_POLICY_PROFILE,
     AllowlistEntry,
     Decision,
+    DecisionCode,
     DenylistEntry,
     ParsedTitle,
     ParserPolicy,
     ParsingMethod,
+    PolicyConfig,
     PolicyProfile,
 )
 from .parser import (
@@ -33,7 +40,31 @@ from .parser import (
     split_artist_title,
 )
 
-__all__ = ["PolicyEngine", "get_policy_engine", "parse_with_policy"]
+__all__ = [
+    "PolicyEngine",
+    "get_policy_engine",
+    "parse_titles_with_policy",
+    "parse_with_policy",
+    "parse_with_policy_cached",
+]
+
+# Stage-B dash tokens in priority order, each with its spaced (Stage-A) form
+_STAGE_B_DASHES = (("-", " - "), ("–", " – "), ("—", " — "))
+
+_ACCEPT = DecisionCode.ACCEPT
+_GRAYLIST = DecisionCode.GRAYLIST
+_REJECT = DecisionCode.REJECT
+
+
+def _score_to_decision(
+    confidence: float, accept_min: float, gray_min: float
+) -> DecisionCode:
+    """Map a confidence score onto its decision code."""
+    if confidence >= accept_min:
+        return _ACCEPT
+    if confidence >= gray_min:
+        return _GRAYLIST
+    return _REJECT
 
 
 @dataclass(frozen=True)
@@ -64,12 +95,26 @@ class PolicyEngine:
             raise ConfigLoadError(str(self.config_dir), "config directory not found")
 
         self.policy = self._load_policy(self.config_dir / "perday_parser_policy.json")
-        self.allowlist, self._allow_exact, self._allow_regex = self._load_allowlist(
-            self.config_dir / "allowlist.json"
-        )
+        (
+            self.allowlist,
+            self._allow_artists,
+            self._allow_boosts,
+            self._allow_regex,
+        ) = self._load_allowlist(self.config_dir / "allowlist.json")
         self.denylist, self._deny_exact, self._deny_regex = self._load_denylist(
             self.config_dir / "denylist.json"
         )
+        self._allow_any = _union_pattern(self._allow_regex)
+        self._deny_any = _union_pattern(self._deny_regex)
+
+        # Channel titles and artist names repeat heavily across a catalog; lists
+        # are fixed for the engine's lifetime, so matches are memoized per engine.
+        self._match_allowlist = functools.lru_cache(maxsize=4096)(  # type: ignore[method-assign]
+            self._match_allowlist
+        )
+        self._match_denylist = functools.lru_cache(maxsize=4096)(  # type: ignore[method-assign]
+            self._match_denylist
+        )
 
     def parse(
         self,
@@ -79,12 +124,60 @@ class PolicyEngine:
     ) -> ParsedTitle:
         """Parse a title and apply policy decisions."""
 
+        return self._parse_one(
+            title, channel_title, profile, self.policy.get_profile(profile)
+        ).to_model()
+
+    def parse_titles(
+        self,
+        titles: Sequence[str],
+        channels: Sequence[str] | None = None,
+        profile: PolicyProfile = DEFAULT_POLICY_PROFILE,
+    ) -> list[ParsedTitle]:
+        """Parse a batch of titles under a single profile.
+
+        ``channels`` pairs with ``titles`` by position and may be omitted when no
+        channel titles are known. The profile is resolved once for the batch.
+        """
+
+        return [record.to_model() for record in self._parse_batch(titles, channels, profile)]
+
+    def _parse_batch(
+        self,
+        titles: Sequence[str],
+        channels: Sequence[str] | None,
+        profile: PolicyProfile,
+    ) -> list[FastParsedTitle]:
+        """Batch parse into internal records, for callers that never expose them."""
+
+        if channels is None:
+            channels = [""] * len(titles)
+        elif len(channels) != len(titles):
+            raise ValidationError(
+                "channels",
+                str(len(channels)),
+                f"expected {len(titles)} entries to match titles",
+            )
+
+        profile_config = self.policy.get_profile(profile)
+        parse_one = self._parse_one
+        return [
+            parse_one(title, channel, profile, profile_config)
+            for title, channel in zip(titles, channels)
+        ]
+
+    def _parse_one(
+        self,
+        title: str,
+        channel_title: str,
+        profile: PolicyProfile,
+        profile_config: PolicyConfig,
+    ) -> FastParsedTitle:
         if not isinstance(title, str) or not title.strip():
             raise ValidationError("title", str(title), "must be a non-empty string")
 
         channel_title = channel_title or ""
         normalized_channel = normalize_channel_title_for_artist(channel_title)
-        profile_config = self.policy.get_profile(profile)
 
         stage_a_artists, candidate_title = split_artist_title(title)
         parsing_method: ParsingMethod = "basic_parsing"
@@ -100,13 +193,15 @@ class PolicyEngine:
         else:
             candidate_title = title.strip()
 
-        stage_b_artist, stage_b_title = self._stage_b_artist_guess(title)
-        if not artist and profile_config.allow_stage_b and stage_b_artist:
-            artist = stage_b_artist
-            candidate_title = stage_b_title
-            parsing_method = "stage_b_recovery"
-            base_confidence = self._BASE_CONFIDENCE[parsing_method]
-            reason_parts.append("Stage-B dash recovery")
+        if not artist and profile_config.allow_stage_b:
+            # Stage B only runs when Stage A found nothing and the profile allows it
+            stage_b_artist, stage_b_title = self._stage_b_artist_guess(title)
+            if stage_b_artist:
+                artist = stage_b_artist
+                candidate_title = stage_b_title
+                parsing_method = "stage_b_recovery"
+                base_confidence = self._BASE_CONFIDENCE[parsing_method]
+                reason_parts.append("Stage-B dash recovery")
 
         parsed_components = parse_title(candidate_title, normalize_youtube_noise=True)
         song_title = parsed_components.get("title", candidate_title)
@@ -120,10 +215,11 @@ class PolicyEngine:
         )
         channel_boost = 0.0
         if allow_hit:
-            channel_boost = allow_hit.confidence_boost or profile_config.oac_boost
+            allowed_artist, allowed_boost = allow_hit
+            channel_boost = allowed_boost or profile_config.oac_boost
             if not artist or parsing_method == "stage_b_recovery":
-                mapping = allow_hit.pattern_or_mapping
-                artist = mapping.get("artist_name", artist)
+                if allowed_artist is not None:
+                    artist = allowed_artist
                 parsing_method = "channel_oac"
                 base_confidence = self._BASE_CONFIDENCE[parsing_method]
             reason_parts.append("OAC channel match")
@@ -138,17 +234,14 @@ class PolicyEngine:
             confidence = 0.0
         else:
             decision = self._decide(confidence, profile_config)
-            if not reason_parts:
-                reason_parts.append("basic parsing")
-            reason_parts.append(f"profile '{profile}' thresholds")
-            if channel_boost:
-                reason_parts.append(f"OAC boost +{channel_boost:.2f}")
-            reason = "; ".join(reason_parts)
-
-        return ParsedTitle(
-            artist=artist,
+            reason = _policy_reason(tuple(reason_parts), profile, channel_boost)
+
+        # Every field is produced above from typed, stripped parts; to_model()
+        # wraps them without re-validating.
+        return FastParsedTitle(
+            artist=artist.strip(),
             title=song_title,
-            features=features,
+            features=tuple(map(sys.intern, features)),
             version=version,
             confidence=confidence,
             decision=decision,
@@ -163,7 +256,7 @@ class PolicyEngine:
     @staticmethod
     def _load_json(path: Path) -> Any:
         try:
-            return json.loads(path.read_text())
+            return _json_loads(path.read_bytes())
         except FileNotFoundError as exc:
             raise ConfigLoadError(str(path), "file missing") from exc
         except json.JSONDecodeError as exc:
@@ -180,22 +273,35 @@ class PolicyEngine:
         self, path: Path
     ) -> tuple[
         list[AllowlistEntry],
-        dict[str, AllowlistEntry],
-        list[tuple[re.Pattern[str], AllowlistEntry]],
+        dict[str, str | None],
+        dict[str, float],
+        list[tuple[re.Pattern[str], str | None, float]],
     ]:
+        """Load allowlist entries plus flat channel -> artist / boost lookups.
+
+        Matching only needs an entry's artist name and boost, so those are kept
+        in parallel dicts keyed by casefolded channel name rather than per-entry
+        mapping dicts.
+        """
         data = self._load_json(path)
         entries = [AllowlistEntry(**raw) for raw in data.get("entries", [])]
-        exact: dict[str, AllowlistEntry] = {}
-        regex_entries: list[tuple[re.Pattern[str], AllowlistEntry]] = []
+        artists: dict[str, str | None] = {}
+        boosts: dict[str, float] = {}
+        regex_entries: list[tuple[re.Pattern[str], str | None, float]] = []
         for entry in entries:
             mapping = entry.pattern_or_mapping
+            artist_name = mapping.get("artist_name")
             channel_name = mapping.get("channel_name")
             if channel_name:
-                exact[channel_name.casefold()] = entry
+                key = channel_name.casefold()
+                artists[key] = artist_name
+                boosts[key] = entry.confidence_boost
             pattern = mapping.get("regex")
             if pattern:
-                regex_entries.append((self._compile_pattern(pattern), entry))
-        return entries, exact, regex_entries
+                regex_entries.append(
+                    (self._compile_pattern(pattern), artist_name, entry.confidence_boost)
+                )
+        return entries, artists, boosts, regex_entries
 
     def _load_denylist(
         self, path: Path
@@ -227,15 +333,18 @@ class PolicyEngine:
     # ------------------------------------------------------------------
     # Matching helpers
     # ------------------------------------------------------------------
-    def _match_allowlist(self, channel_title: str) -> AllowlistEntry | None:
+    def _match_allowlist(self, channel_title: str) -> tuple[str | None, float] | None:
+        """Return ``(artist_name, confidence_boost)`` for an allowlisted channel."""
         if not channel_title:
             return None
         normalized = channel_title.casefold()
-        if normalized in self._allow_exact:
-            return self._allow_exact[normalized]
-        for pattern, entry in self._allow_regex:
+        if normalized in self._allow_boosts:
+            return self._allow_artists[normalized], self._allow_boosts[normalized]
+        if self._allow_any is not None and not self._allow_any.search(channel_title):
+            return None
+        for pattern, artist_name, boost in self._allow_regex:
             if pattern.search(channel_title):
-                return entry
+                return artist_name, boost
         return None
 
     def _match_denylist(self, value: str) -> _DenylistHit | None:
@@ -246,6 +355,10 @@ class PolicyEngine:
         entry = self._deny_exact.get(key)
         if entry:
             return _DenylistHit(entry=entry, source_value=value)
+        # One scan rules out the common clean value; on a hit, walk the entries
+        # in order so the first listed match is still the one reported.
+        if self._deny_any is not None and not self._deny_any.search(value):
+            return None
         for pattern, candidate in self._deny_regex:
             if pattern.search(value):
                 return _DenylistHit(entry=candidate, source_value=value)
@@ -255,11 +368,9 @@ class PolicyEngine:
     # Decision helpers
     # ------------------------------------------------------------------
     def _decide(self, confidence: float, profile: Any) -> Decision:
-        if confidence >= profile.accept_min:
-            return "accept"
-        if confidence >= profile.gray_min:
-            return "graylist"
-        return "reject"
+        return DECISION_NAMES[
+            _score_to_decision(confidence, profile.accept_min, profile.gray_min)
+        ]
 
     @staticmethod
     def _clamp_confidence(value: float) -> float:
@@ -280,9 +391,9 @@ class PolicyEngine:
     def _stage_b_artist_guess(full_title: str) -> tuple[str, str]:
         if not isinstance(full_title, str):
             return "", ""
-        for token in ("-", "–", "—"):
-            if token in full_title and f" {token} " not in full_title:
-                left, right = full_title.split(token, 1)
+        for token, spaced in _STAGE_B_DASHES:
+            if token in full_title and spaced not in full_title:
+                left, _, right = full_title.partition(token)
                 left = left.strip()
                 right = right.strip()
                 if left and right:
@@ -290,6 +401,45 @@ class PolicyEngine:
         return "", full_title.strip()
 
 
+@functools.lru_cache(maxsize=256)
+def _policy_reason(
+    steps: tuple[str, ...], profile: PolicyProfile, channel_boost: float
+) -> str:
+    """Build the accept / graylist reason; the few distinct ones are shared across results."""
+    parts = list(steps) or ["basic parsing"]
+    parts.append(f"profile '{profile}' thresholds")
+    if channel_boost:
+        parts.append(f"OAC boost +{channel_boost:.2f}")
+    return "; ".join(parts)
+
+
+# Numbered backreferences (\1) and conditional group references ((?(1)...)).
+# Joining renumbers every capture group, so a pattern using either would silently
+# stop matching inside the union. A false positive (say, an escaped backslash
+# before a digit) only turns the prefilter off.
+_GROUP_REFERENCE_RE = re.compile(r"\\[1-9]|\(\?\(")
+
+
+def _union_pattern(
+    entries: Sequence[tuple[Any, ...]],
+) -> re.Pattern[str] | None:
+    """Join the compiled patterns leading each entry into one prefilter alternation.
+
+    Returns ``None`` when there is nothing to join or the patterns can't be
+    combined safely (group references, clashing group names), in which case
+    callers check each pattern on its own.
+    """
+    if not entries:
+        return None
+    sources = [entry[0].pattern for entry in entries]
+    if any(_GROUP_REFERENCE_RE.search(source) for source in sources):
+        return None
+    try:
+        return re.compile("|".join(f"(?:{source})" for source in sources), re.IGNORECASE)
+    except re.error:
+        return None
+
+
 _ENGINE_INSTANCE: PolicyEngine | None = None
 
 
@@ -311,3 +461,30 @@ def parse_with_policy(
 
     engine = get_policy_engine()
     return engine.parse(title=title, channel_title=channel_title, profile=profile)
+
+
+def parse_titles_with_policy(
+    titles: Sequence[str],
+    channels: Sequence[str] | None = None,
+    profile: PolicyProfile = DEFAULT_POLICY_PROFILE,
+) -> list[ParsedTitle]:
+    """Batch helper that proxies to the singleton policy engine."""
+
+    engine = get_policy_engine()
+    return engine.parse_titles(titles, channels, profile)
+
+
+@functools.lru_cache(maxsize=100_000)
+def parse_with_policy_cached(
+    title: str,
+    channel_title: str = "",
+    profile: PolicyProfile = DEFAULT_POLICY_PROFILE,
+) -> ParsedTitle:
+    """Memoized :func:`parse_with_policy` for catalogs with repeated titles.
+
+    Results are shared between calls with the same arguments, so treat them as
+    read-only. Use ``cache_info()`` / ``cache_clear()`` on this function to
+    inspect hit rates or reset after reloading policy files.
+    """
+
+    return parse_with_policy(title, channel_title, profile)
@@ -11,6 +11,8 @@ Shows actual problematic cases and lets users create rules visually.
 from __future__ import annotations
 
 import json
+import os
+import re
 from pathlib import Path
 from typing import Any
 
@@ -26,8 +28,55 @@ except ImportError:
     print("❌ Rich library required. Install with: pip install rich")
     raise
 
+from ._json import loads as _json_loads
 from .parser import parse_title, split_artist_title
 
+# Contents of each (), [] or {} segment in a title
+_SEGMENT_RE = re.compile(r"[(\[{]([^)\]}]*)[)\]}]")
+# Words that mark a segment as a likely version tag
+_VERSION_KEYWORD_RE = re.compile(
+    r"slowed|acoustic|live|remix|visual|official|lyric", re.IGNORECASE
+)
+
+# Demo examples shown when no database is configured; shared, and only ever read
+_MOCK_EXAMPLES: tuple[dict[str, Any], ...] = (
+    {
+        "title": "Lute / Cozz - Eye To Eye ( Slowed To Perfection ) Visiualizer",
+        "versions_found": ["Slowed", "Visualizer"],
+        "current_result": "Slowed",
+        "count": 15,
+        "is_problematic": True,
+    },
+    {
+        "title": "Song Title (Acoustic) (Official Video)",
+        "versions_found": ["Acoustic", "Official Video"],
+        "current_result": "Acoustic",
+        "count": 8,
+        "is_problematic": False,
+    },
+    {
+        "title": "Artist - Track (Remix) (Lyric Video)",
+        "versions_found": ["Remix", "Lyric Video"],
+        "current_result": "Remix",
+        "count": 23,
+        "is_problematic": False,
+    },
+    {
+        "title": "Song (Live Performance) (Visualizer)",
+        "versions_found": ["Live", "Visualizer"],
+        "current_result": "Live",
+        "count": 5,
+        "is_problematic": True,
+    },
+    {
+        "title": "Track (Nightcore) (Official Music Video)",
+        "versions_found": ["Nightcore", "Official Video"],
+        "current_result": "Nightcore",
+        "count": 12,
+        "is_problematic": True,
+    },
+)
+
 
 class VersionRuleManager:
     """Interactive manager for version mapping rules."""
@@ -41,8 +90,7 @@ class VersionRuleManager:
         """Load existing rules from JSON file."""
         if self.rules_file.exists():
             try:
-                with open(self.rules_file) as f:
-                    return json.load(f)
+                return _json_loads(self.rules_file.read_bytes())
             except Exception as e:
                 self.console.print(f"⚠️  Error loading rules: {e}", style="yellow")
         return {}
@@ -50,8 +98,16 @@ class VersionRuleManager:
     def _save_rules(self) -> None:
         """Save rules to JSON file."""
         try:
-            with open(self.rules_file, "w") as f:
-                json.dump(self.rules, f, indent=2, sort_keys=True)
+            # Write beside the target and swap it in, so a failed write never
+            # leaves a truncated rules file
+            tmp_file = self.rules_file.with_name(self.rules_file.name + ".tmp")
+            try:
+                with open(tmp_file, "w") as f:
+                    json.dump(self.rules, f, indent=2, sort_keys=True)
+                os.replace(tmp_file, self.rules_file)
+            except BaseException:
+                tmp_file.unlink(missing_ok=True)
+                raise
             self.console.print(f"✅ Rules saved to {self.rules_file}", style="green")
         except Exception as e:
             self.console.print(f"❌ Error saving rules: {e}", style="red")
@@ -89,8 +145,9 @@ class VersionRuleManager:
 
             engine = create_engine(database_url)
 
-            # Query your actual YouTube titles
-            with engine.begin() as conn:
+            # Query your actual YouTube titles; nothing is written, so a plain
+            # connection replaces begin() / commit, and rows stream instead of buffering
+            with engine.connect().execution_options(stream_results=True) as conn:
                 result = conn.execute(
                     text(
                         """
@@ -106,10 +163,10 @@ class VersionRuleManager:
                     )
                 )
 
-                examples = []
-                for row in result:
-                    title = row[0]
-                    count = row[1]
+                examples: list[dict[str, Any]] = []
+                for title, count in result:
+                    if len(examples) >= 20:  # Return top 20 examples
+                        break
 
                     # Parse the title to see what versions are detected
                     try:
@@ -121,26 +178,12 @@ class VersionRuleManager:
 
                         # Check if this looks like a multi - version case
                         # Look for multiple parentheses / brackets that might contain versions
-                        import re
-
-                        segments = re.findall(r"[(\[{]([^)\]}]*)[)\]}]", title)
-
-                        potential_versions = []
-                        for segment in segments:
+                        potential_versions = [
+                            segment.strip()
+                            for segment in _SEGMENT_RE.findall(title)
                             # Simple check if segment looks like a version
-                            if any(
-                                keyword in segment.lower()
-                                for keyword in [
-                                    "slowed",
-                                    "acoustic",
-                                    "live",
-                                    "remix",
-                                    "visual",
-                                    "official",
-                                    "lyric",
-                                ]
-                            ):
-                                potential_versions.append(segment.strip())
+                            if _VERSION_KEYWORD_RE.search(segment)
+                        ]
 
                         is_problematic = len(potential_versions) > 1
 
@@ -159,7 +202,7 @@ class VersionRuleManager:
                         # Skip titles that can't be parsed
                         continue
 
-                return examples[:20]  # Return top 20 examples
+                return examples
 
         except Exception as e:
             self.console.print(f"⚠️  Database error: {e}", style="yellow")
@@ -167,52 +210,16 @@ class VersionRuleManager:
 
     def _get_mock_examples(self) -> list[dict[str, Any]]:
         """Get mock examples for demo purposes."""
-        problematic_examples = [
-            {
-                "title": "Lute / Cozz - Eye To Eye ( Slowed To Perfection ) Visiualizer",
-                "versions_found": ["Slowed", "Visualizer"],
-                "current_result": "Slowed",
-                "count": 15,
-                "is_problematic": True,
-            },
-            {
-                "title": "Song Title (Acoustic) (Official Video)",
-                "versions_found": ["Acoustic", "Official Video"],
-                "current_result": "Acoustic",
-                "count": 8,
-                "is_problematic": False,
-            },
-            {
-                "title": "Artist - Track (Remix) (Lyric Video)",
-                "versions_found": ["Remix", "Lyric Video"],
-                "current_result": "Remix",
-                "count": 23,
-                "is_problematic": False,
-            },
-            {
-                "title": "Song (Live Performance) (Visualizer)",
-                "versions_found": ["Live", "Visualizer"],
-                "current_result": "Live",
-                "count": 5,
-                "is_problematic": True,
-            },
-            {
-                "title": "Track (Nightcore) (Official Music Video)",
-                "versions_found": ["Nightcore", "Official Video"],
-                "current_result": "Nightcore",
-                "count": 12,
-                "is_problematic": True,
-            },
-        ]
-
-        return problematic_examples
+        return list(_MOCK_EXAMPLES)
 
     def show_database_analysis(self, examples: list[dict[str, Any]]) -> None:
         """Show analysis of database examples with current parsing results."""
 
-        # Separate problematic and good examples
-        problematic = [ex for ex in examples if ex.get("is_problematic", False)]
-        good_examples = [ex for ex in examples if not ex.get("is_problematic", False)]
+        # Separate problematic and good examples in one pass
+        problematic: list[dict[str, Any]] = []
+        good_examples: list[dict[str, Any]] = []
+        for ex in examples:
+            (problematic if ex.get("is_problematic", False) else good_examples).append(ex)
 
         if problematic:
             self.console.print(
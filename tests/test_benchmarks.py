@@ -0,0 +1,23 @@
+# SPDX-License-Identifier: MIT
+
+"""Tests covering the benchmark helpers."""
+
+from __future__ import annotations
+
+import pytest
+from music_title_parser import benchmarks
+
+
+def test_stream_benchmark_tallies_every_chunk(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(benchmarks, "_STREAM_CHUNK_SIZE", 10)
+
+    streamed = benchmarks.run_basic_benchmark(num_titles=25, stream=True)
+    batched = benchmarks.run_basic_benchmark(num_titles=25)
+
+    assert streamed.rows_processed == 25
+    assert streamed.metadata["timed_path"] == "engine_records"
+    assert batched.metadata["timed_path"] == "parse_titles"
+    for key in ("accepted", "rejected", "graylist"):
+        assert streamed.metadata[key] == batched.metadata[key]
+    assert sum(streamed.metadata[key] for key in ("accepted", "rejected", "graylist")) == 25
+    assert streamed.memory_mb >= 0.0
@@ -0,0 +1,74 @@
+# SPDX-License-Identifier: MIT
+
+"""Tests covering command-line argument handling."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+from music_title_parser import cli
+
+
+def _run(monkeypatch: pytest.MonkeyPatch, *argv: str) -> int:
+    monkeypatch.setattr(sys, "argv", ["music-title-parser", *argv])
+    try:
+        cli.main()
+    except SystemExit as exc:
+        return int(exc.code or 0)
+    return 0
+
+
+def test_parse_accepts_dash_leading_title(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    assert _run(monkeypatch, "parse", "-Intro") == 0
+    assert "Title: '-Intro'" in capsys.readouterr().out
+
+
+def test_parse_reads_channel_and_profile_positionally(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    assert _run(monkeypatch, "parse", "Anti-Hero", "Taylor Swift - Topic", "strict") == 0
+    out = capsys.readouterr().out
+    assert "Artist: 'Taylor Swift'" in out
+    assert "Profile: strict" in out
+
+
+def test_unknown_command_shows_help_and_exits_1(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    assert _run(monkeypatch, "bogus") == 1
+    assert "Usage:" in capsys.readouterr().out
+
+
+def test_stray_arguments_are_rejected(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    assert _run(monkeypatch, "parse", "Song", "", "balanced", "extra") == 1
+    assert _run(monkeypatch, "validate", "--verbose") == 1
+    assert "Title:" not in capsys.readouterr().out
+
+
+def test_parse_without_title_exits_1(monkeypatch: pytest.MonkeyPatch) -> None:
+    assert _run(monkeypatch, "parse") == 1
+
+
+def test_help_exits_0(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    assert _run(monkeypatch, "--help") == 0
+    assert "Usage:" in capsys.readouterr().out
+
+
+def test_importing_cli_does_not_load_the_policy_engine() -> None:
+    code = (
+        "import sys, music_title_parser.cli; "
+        "print('pydantic' in sys.modules, 'music_title_parser.policy_engine' in sys.modules)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+
+    assert out.split() == ["False", "False"]
@@ -9,7 +9,12 @@ and version identification capabilities.
 """
 
 import pytest
-from music_title_parser.parser import parse_title, split_artist_title
+from music_title_parser.parser import (
+    compile_version_table,
+    parse_title,
+    parse_titles,
+    split_artist_title,
+)
 
 
 class TestBasicTitleParsing:
@@ -229,6 +234,51 @@ class TestComplexTitleParsing:
         assert parse_title(title, normalize_youtube_noise=True) == expected
 
 
+class TestVersionMappingTable:
+    """Test custom version mapping tables."""
+
+    def test_combination_key_ignores_order_and_spacing(self):
+        """Test that compiled "a + b" and "b+a" keys resolve the same combination."""
+        for key in ("acoustic + live", "live+acoustic"):
+            table = compile_version_table({key: "acoustic live"})
+            result = parse_title("Song (Acoustic) (Live)", version_mapping_table=table)
+            assert result["version"] == "Acoustic Live"
+
+    def test_raw_combination_key_forms(self):
+        """Test the sorted "a+b" and "a + b" key forms a raw dict is probed with."""
+        for key in ("acoustic+live", "acoustic + live", "live + acoustic"):
+            result = parse_title(
+                "Song (Live) (Acoustic)", version_mapping_table={key: "acoustic live"}
+            )
+            assert result["version"] == "Acoustic Live"
+
+    def test_compiled_table_matches_raw_table(self):
+        """Test that a precompiled table gives the same results as the raw dict."""
+        table = {"slowed + remix": "remix", "live version": "live performance"}
+        compiled = compile_version_table(table)
+
+        for title in ("Song (Slowed) (Remix)", "Song (Live Version)", "Song (Live)"):
+            assert parse_title(title, version_mapping_table=compiled) == parse_title(
+                title, version_mapping_table=table
+            )
+
+
+class TestBatchParsing:
+    """Test batch title parsing."""
+
+    def test_batch_matches_single_parses(self):
+        """Test that parse_titles gives the same results as parse_title per title."""
+        table = {"slowed + remix": "remix"}
+        titles = ["Song (Slowed) (Remix)", "Song feat. Artist A (Live)", "Song [Official Video]"]
+
+        assert parse_titles(titles, version_mapping_table=table) == [
+            parse_title(title, version_mapping_table=table) for title in titles
+        ]
+        assert parse_titles(titles, normalize_youtube_noise=True) == [
+            parse_title(title, normalize_youtube_noise=True) for title in titles
+        ]
+
+
 class TestArtistTitleSplitting:
     """Test artist and title splitting functionality."""
 
@@ -339,6 +389,14 @@ class TestEdgeCases:
         assert "Song #1" in result["title"]
         assert len(result["features"]) > 0
 
+    def test_repeated_title_returns_independent_results(self):
+        """Test that memoized parses don't share mutable results."""
+        title = "Song Title (feat. Artist A)"
+        first = parse_title(title)
+        first["features"].append("Mutated")
+
+        assert parse_title(title)["features"] == ["Artist A"]
+
 
 class TestIntegration:
     """Integration tests with realistic scenarios."""
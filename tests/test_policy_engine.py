@@ -4,9 +4,36 @@
 
 from __future__ import annotations
 
+import json
+import shutil
+from pathlib import Path
+
+import music_title_parser
 import pytest
 from music_title_parser.exceptions import ValidationError
-from music_title_parser.policy_engine import PolicyEngine, parse_with_policy
+from music_title_parser.policy_engine import (
+    PolicyEngine,
+    parse_titles_with_policy,
+    parse_with_policy,
+    parse_with_policy_cached,
+)
+from pydantic import ValidationError as PydanticValidationError
+
+CONFIG_DIR = Path(music_title_parser.__file__).resolve().parent / "config"
+
+
+def _engine_with_regex_entries(
+    tmp_path: Path, list_name: str, *mappings: dict[str, str]
+) -> PolicyEngine:
+    """Build an engine from the bundled config plus extra regex list entries."""
+    config_dir = tmp_path / "config"
+    shutil.copytree(CONFIG_DIR, config_dir)
+    list_path = config_dir / list_name
+    data = json.loads(list_path.read_text())
+    template = data["entries"][0]
+    data["entries"] += [{**template, "pattern_or_mapping": mapping} for mapping in mappings]
+    list_path.write_text(json.dumps(data))
+    return PolicyEngine(config_dir)
 
 
 def test_parse_with_policy_uses_allowlist_oac_channel() -> None:
@@ -51,3 +78,70 @@ def test_parse_with_policy_validates_title_input() -> None:
     engine = PolicyEngine()
     with pytest.raises(ValidationError):
         engine.parse("", profile="balanced")
+
+
+def test_parse_with_policy_cached_reuses_results() -> None:
+    parse_with_policy_cached.cache_clear()
+
+    first = parse_with_policy_cached("Artist X - Midnight", "", "balanced")
+    second = parse_with_policy_cached("Artist X - Midnight", "", "balanced")
+
+    assert first is second
+    assert first == parse_with_policy("Artist X - Midnight", "", "balanced")
+    assert parse_with_policy_cached.cache_info().hits == 1
+
+
+def test_parse_titles_matches_single_parses() -> None:
+    titles = ["Artist X - Midnight", "Anti-Hero", "Any Song"]
+    channels = ["", "Taylor Swift - Topic", "word 4 word🎼"]
+
+    batch = parse_titles_with_policy(titles, channels, "balanced")
+
+    assert batch == [
+        parse_with_policy(title, channel, "balanced")
+        for title, channel in zip(titles, channels)
+    ]
+
+
+def test_parse_titles_rejects_mismatched_channels() -> None:
+    engine = PolicyEngine()
+    with pytest.raises(ValidationError):
+        engine.parse_titles(["Song A", "Song B"], ["only one"])
+
+
+def test_denylist_backreference_rule_still_rejects(tmp_path: Path) -> None:
+    # Joining patterns renumbers groups, so \1 must not go through the union prefilter
+    engine = _engine_with_regex_entries(
+        tmp_path, "denylist.json", {"regex": r"(a)\1", "description": "doubled a"}
+    )
+
+    result = engine.parse("Any Song", "aa", "balanced")
+
+    assert result.decision == "reject"
+    assert result.reason == "Denylist: doubled a"
+
+
+def test_allowlist_backreference_rule_still_matches(tmp_path: Path) -> None:
+    # The first rule's group shifts the second rule's \1 if they are joined
+    engine = _engine_with_regex_entries(
+        tmp_path,
+        "allowlist.json",
+        {"regex": r"^(Radio) Hits$", "artist_name": "Radio Hits"},
+        {"regex": r"^(\w+) \1$", "artist_name": "Echo Artist"},
+    )
+
+    result = engine.parse("Any Song", "echo echo", "balanced")
+
+    assert result.artist == "Echo Artist"
+    assert result.parsing_method == "channel_oac"
+
+
+def test_loaded_config_models_are_frozen() -> None:
+    engine = PolicyEngine()
+
+    with pytest.raises(PydanticValidationError):
+        engine.policy.profiles["balanced"].accept_min = 5.0
+    with pytest.raises(PydanticValidationError):
+        engine.allowlist[0].description = "changed"
+    with pytest.raises(PydanticValidationError):
+        engine.denylist[0].description = "changed"
@@ -0,0 +1,57 @@
+# SPDX-License-Identifier: MIT
+
+"""Tests for the SQL script splitting used by the database setup script."""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+_SETUP_PATH = Path(__file__).resolve().parents[1] / "sql" / "setup_module.py"
+_spec = importlib.util.spec_from_file_location("sql_setup_module", _SETUP_PATH)
+assert _spec is not None and _spec.loader is not None
+sql_setup = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(sql_setup)
+split = sql_setup._split_sql_statements
+
+
+def test_splits_on_terminators() -> None:
+    assert split("SELECT 1;\nSELECT 2;") == ["SELECT 1", "SELECT 2"]
+
+
+def test_trailing_statement_without_terminator_is_kept() -> None:
+    assert split("SELECT 1; SELECT 2") == ["SELECT 1", "SELECT 2"]
+
+
+def test_semicolons_inside_quotes_do_not_split() -> None:
+    sql = "INSERT INTO t VALUES ('a;b', \"c;d\", 'it''s; ok', 'x\\';y'); SELECT `col;name` FROM t;"
+
+    assert split(sql) == [
+        "INSERT INTO t VALUES ('a;b', \"c;d\", 'it''s; ok', 'x\\';y')",
+        "SELECT `col;name` FROM t",
+    ]
+
+
+def test_dash_dash_comments_are_skipped() -> None:
+    sql = "-- don't; split here\nSELECT 1; -- trailing; note\nSELECT 2;"
+
+    assert split(sql) == ["-- don't; split here\nSELECT 1", "-- trailing; note\nSELECT 2"]
+
+
+def test_double_dash_without_whitespace_is_not_a_comment() -> None:
+    assert split("SELECT 1--1;\nSELECT 2;") == ["SELECT 1--1", "SELECT 2"]
+    assert split("SELECT 1; --") == ["SELECT 1"]
+
+
+def test_block_comments_are_skipped() -> None:
+    sql = "/* it's; a\nmulti-line comment */ SELECT 1; SELECT /* ; */ 2;"
+
+    assert split(sql) == ["/* it's; a\nmulti-line comment */ SELECT 1", "SELECT /* ; */ 2"]
+
+
+def test_hash_comments_are_skipped() -> None:
+    assert split("# don't\nSELECT 1; SELECT 2;") == ["# don't\nSELECT 1", "SELECT 2"]
+
+
+def test_comment_only_chunks_are_dropped() -> None:
+    assert split("SELECT 1;\n-- done;\n# really;\n/* end */") == ["SELECT 1"]
@@ -13,6 +13,11 @@ import os
 
 import yaml
 
+try:  # libyaml - backed parser when PyYAML was built with it
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 
 def validate_policy_files():
     """Validate both YAML and JSON policy files."""
@@ -39,7 +44,7 @@ def validate_policy_files():
     # Load and validate YAML
     try:
         with open(yaml_path) as f:
-            yaml_config = yaml.safe_load(f)
+            yaml_config = yaml.load(f, Loader=_SafeLoader)
         print("✅ YAML file loads successfully")
     except Exception as e:
         issues.append(f"❌ YAML parsing error: {e}")